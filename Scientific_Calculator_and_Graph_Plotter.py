@@ -1,12 +1,38 @@
+import ast
+import functools
 import tkinter as tk
 from tkinter import messagebox
 import math
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('TkAgg')
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 import sympy as sp
 import logging
 
+# Numba is optional; plotting falls back to plain NumPy without it
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Symengine is optional; evaluation falls back to sympy without it
+try:
+    import symengine
+except ImportError:
+    symengine = None
+
+# Numexpr is optional; plotting falls back to lambdify without it
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Full-precision constant strings inserted by the pi and e buttons
+_PI_STR = repr(math.pi)
+_E_STR = repr(math.e)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -31,87 +57,278 @@ class ScientificCalculatorConfig:
 
 class MathExpressionEvaluator:
 
+    # Native math functions allowed on the fast numeric path.
+    NUMERIC_FUNCTIONS = {
+        'abs': abs, 'sin': math.sin, 'cos': math.cos,
+        'tan': math.tan, 'log': math.log, 'ln': math.log,
+        'exp': math.exp, 'sqrt': math.sqrt,
+        'factorial': math.factorial}
+
+    """Validate that an AST only contains plain arithmetic and calls
+       to whitelisted math functions, so it is safe to eval natively."""
+    class _NumericValidator(ast.NodeVisitor):
+        _ALLOWED = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+                    ast.operator, ast.unaryop, ast.Load)
+
+        def generic_visit(self, node):
+            if not isinstance(node, self._ALLOWED):
+                raise ValueError(f"Unsupported node: {type(node).__name__}")
+            super().generic_visit(node)
+
+        def visit_Call(self, node):
+            if (not isinstance(node.func, ast.Name)
+                    or node.func.id not in MathExpressionEvaluator.NUMERIC_FUNCTIONS
+                    or node.keywords):
+                raise ValueError("Unsupported function call")
+            for arg in node.args:
+                self.visit(arg)
+
+        def visit_Constant(self, node):
+            if not isinstance(node.value, (int, float, complex)):
+                raise ValueError("Non-numeric constant")
+
+    """Compile a purely numeric expression to a code object, caching
+       compiled results per expression string.
+        Args: expression (str): Mathematical expression to compile
+        Returns: code: Compiled code object for eval()"""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile_numeric(expression: str):
+        tree = ast.parse(expression, mode='eval')
+        MathExpressionEvaluator._NumericValidator().visit(tree)
+        return compile(tree, '<calculator>', 'eval')
+
+    """Lambdify a constant sympy expression against the math module,
+       caching the compiled callable per expression. Plain double
+       evaluation beats evalf's arbitrary-precision machinery."""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _scalar_lambdify(expr):
+        return sp.lambdify((), expr, modules='math')
+
     """Safely evaluate mathematical expressions.
         Args: expression (str): Mathematical expression to evaluate
               precision (int): Number of decimal places to round
         Returns:str: Evaluated result"""
     @staticmethod
     def safe_evaluate(expression: str, precision: int = 8) -> str:
+        # Fast path: pure-numeric expressions skip sympy entirely.
+        try:
+            code = MathExpressionEvaluator._compile_numeric(expression)
+            result = float(eval(code, {'__builtins__': {}},
+                                MathExpressionEvaluator.NUMERIC_FUNCTIONS))
+            return f"{result:.{precision}f}"
+        except Exception:
+            pass
+
+        # Symengine parses and evaluates numeric expressions much faster
+        # than sympy's sympify + evalf when it is installed
+        if symengine is not None:
+            try:
+                result = float(symengine.sympify(expression))
+                return f"{result:.{precision}f}"
+            except Exception:
+                pass
+
         try:
             x = sp.Symbol('x')
             safe_functions = {
-                'abs': sp.Abs, 'sin': sp.sin, 'cos': sp.cos, 
-                'tan': sp.tan, 'log': sp.log, 'ln': sp.log, 
-                'exp': sp.exp, 'sqrt': sp.sqrt, 
+                'abs': sp.Abs, 'sin': sp.sin, 'cos': sp.cos,
+                'tan': sp.tan, 'log': sp.log, 'ln': sp.log,
+                'exp': sp.exp, 'sqrt': sp.sqrt,
                 'factorial': sp.factorial}
-            
-            # Replace ln to log 
-            expression = expression.replace('ln(', 'log(')
-            
+
+            # 'ln' resolves to sp.log via the locals dict, so no string
+            # rewrite pass is needed before parsing
             expr = sp.sympify(expression, locals=safe_functions)
-            result = float(expr.evalf())
+            # Number atoms convert via __float__ directly; other constant
+            # expressions go through a cached math-module lambdify, and
+            # only symbolic results need the evalf tree walk. Complex
+            # infinity (zoo, e.g. from 2/0 or log(0)) must stay on the
+            # evalf path, where float() raises and yields "ERROR" instead
+            # of the lambdify printer's silent nan
+            if expr.is_Number:
+                result = float(expr)
+            elif not expr.free_symbols and not expr.has(sp.zoo):
+                result = float(MathExpressionEvaluator._scalar_lambdify(expr)())
+            else:
+                result = float(expr.evalf())
             return f"{result:.{precision}f}"
         except Exception as e:
             logger.error(f"Expression evaluation error: {e}")
             return "ERROR"
 
+"""Parse an expression string into a sympy expression, cached per
+   string so repeated plots skip the sympify step."""
+@functools.lru_cache(maxsize=64)
+def _parse_plot_expression(expression: str):
+    safe_functions = {
+        'sin': sp.sin, 'cos': sp.cos, 'tan': sp.tan,
+        'log': sp.log, 'exp': sp.exp, 'sqrt': sp.sqrt}
+    return sp.sympify(expression, locals=safe_functions)
+
+"""Parse an expression and convert it to a numpy-compatible function.
+   Cached so re-plotting the same expression (e.g. after changing the
+   domain) skips the expensive sympify + lambdify step.
+    Args: expression (str): Mathematical expression in x
+    Returns: Callable: Vectorized function of x"""
+@functools.lru_cache(maxsize=64)
+def _compile_plot_function(expression: str):
+    expr = _parse_plot_expression(expression)
+    # cse=True deduplicates repeated subtrees (e.g. sin(x) used twice)
+    # so each is evaluated once per grid instead of once per occurrence
+    return sp.lambdify(sp.Symbol('x'), expr, modules='numpy', cse=True)
+
+# Expressions whose numba kernel failed at evaluation time (e.g. a math
+# domain error); they stay on the NumPy path from then on
+_numba_rejected = set()
+
+"""Compile a numba-vectorized scalar kernel for an expression: the
+   math-module lambdify is wrapped into a parallel ufunc, avoiding
+   per-op NumPy dispatch. Raises if numba cannot compile it."""
+@functools.lru_cache(maxsize=64)
+def _compile_plot_function_numba(expression: str):
+    expr = _parse_plot_expression(expression)
+    scalar_f = sp.lambdify(sp.Symbol('x'), expr, modules='math')
+    return numba.vectorize(['float64(float64)'],
+                           target='parallel')(scalar_f)
+
 class GraphPlotter:
-    
+
     """Initialize graph plotter.
         Args: master: Parent tkinter widget
               figsize (tuple): Figure size
               dpi (int): Dots per inch for resolution"""
     def __init__(self, master, figsize: tuple = (5, 4), dpi: int = 100):
-        self.fig, self.ax = plt.subplots(figsize=figsize, dpi=dpi)
+        # A plain Figure avoids pyplot's global Gcf registry, which would
+        # keep every plotter instance alive and pull in the whole pyplot
+        # machinery at import time
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=master)
         self.canvas_widget = self.canvas.get_tk_widget()
-    
+        # Preallocated grid and output buffer for the default domain,
+        # reused across plots to avoid re-allocating per click
+        self._x = np.linspace(-10, 10, 400)
+        self._y = np.empty_like(self._x)
+
+        # Static axes decorations are drawn once; the curve, legend and
+        # error text are animated artists updated per plot and blitted,
+        # so re-plots skip the full axis/grid/tick rerender
+        self._line, = self.ax.plot([], [], label="y", animated=True)
+        self.ax.axhline(0, color='black', linewidth=0.5)
+        self.ax.axvline(0, color='black', linewidth=0.5)
+        self.ax.grid(True, linestyle='--', alpha=0.7)
+        self._legend = self.ax.legend(loc='upper right')
+        self._legend.set_animated(True)
+        self._err_text = self.ax.text(0.5, 0.5, "",
+                                      fontsize=12, color='red',
+                                      ha='center', va='center',
+                                      transform=self.ax.transAxes,
+                                      animated=True)
+        self._bg = None
+        self._limits = None
+        self._has_plot = False
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    # Every full redraw (e.g. triggered by a window resize) skips
+    # animated artists, so recapture the fresh background and paint the
+    # current plot back on top; without this the curve would vanish
+    # after any resize until the next Plot press.
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        if not self._has_plot:
+            return
+        if self._err_text.get_text():
+            self.ax.draw_artist(self._err_text)
+        else:
+            self.ax.draw_artist(self._line)
+            self.ax.draw_artist(self._legend)
+
+    # Redraw the static background (axes, grid, ticks) only when the
+    # domain changed or the canvas was redrawn, then cache it for blitting.
+    def _refresh_background(self, start: float, end: float) -> None:
+        if self._bg is None or (start, end) != self._limits:
+            self.ax.set_xlim(start, end)
+            self.ax.set_ylim(start, end)
+            # Synchronous draw (not draw_idle): _on_draw captures the
+            # background snapshot before the animated artists repaint
+            self.canvas.draw()
+            self._limits = (start, end)
+
     """Plot a mathematical function with a specified domain."""
     def plot_function_with_domain(self, expression: str, start: float= -10, end: float = 10) -> None:
         try:
             expression = expression.replace('^', '**')
-            x_sym = sp.Symbol('x')
 
-            safe_functions = {
-                'sin': sp.sin, 'cos': sp.cos, 'tan': sp.tan,
-                'log': sp.log, 'exp': sp.exp, 'sqrt': sp.sqrt}
+            # Generate plot data with the specified domain
+            if (start, end) == (-10, 10):
+                x, out = self._x, self._y
+            else:
+                x, out = np.linspace(start, end, 400), None
+
+            # numexpr fuses chained ufuncs into a single pass over the
+            # grid; unsupported expressions fall back to lambdify
+            y = None
+            if numexpr is not None:
+                try:
+                    y = numexpr.evaluate(expression, local_dict={'x': x})
+                except Exception:
+                    y = None
+            # The numba kernel keeps Python semantics for math.sqrt and
+            # math.log, so partially-defined functions raise a domain
+            # error at evaluation; catch it here and fall back to the
+            # NumPy lambdify, which yields NaN for the invalid half
+            if (y is None and numba is not None
+                    and expression not in _numba_rejected):
+                try:
+                    y = _compile_plot_function_numba(expression)(x)
+                except Exception as e:
+                    logger.info(f"Numba path failed, using NumPy: {e}")
+                    _numba_rejected.add(expression)
+            if y is None:
+                y = _compile_plot_function(expression)(x)
+            if out is not None:
+                np.copyto(out, y)
+                y = out
+            else:
+                y = np.asarray(y, dtype=float)
 
-            # Parse and convert to numpy-compatible function
-            expr = sp.sympify(expression, locals=safe_functions)
-            f = sp.lambdify(x_sym, expr, modules='numpy')
+            # Mask invalid results (infinity or NaN values) in place;
+            # NaN points render as gaps instead of copying both arrays
+            y[~np.isfinite(y)] = np.nan
 
-            # Generate plot data with the specified domain
-            x = np.linspace(start, end, 400)
-            y = f(x)
-
-            # Filter out invalid results (infinity or NaN values)
-            valid = np.isfinite(y)
-            x, y = x[valid], y[valid]
-
-            # Clear previous plot and draw new one
-            self.ax.clear()
-            self.ax.plot(x, y, label=f"y = {expression}")
-            self.ax.axhline(0, color='black', linewidth=0.5)
-            self.ax.axvline(0, color='black', linewidth=0.5)
-            self.ax.grid(True, linestyle='--', alpha=0.7)
-            self.ax.set_xlim(start, end)
-            self.ax.set_ylim(start,end)
-            self.ax.legend()
-            self.canvas.draw()
+            # Update the persistent line and blit it over the cached
+            # background instead of clearing and redrawing everything
+            self._line.set_data(x, y)
+            self._legend.get_texts()[0].set_text(f"y = {expression}")
+            self._err_text.set_text("")
+            self._has_plot = True
+
+            self._refresh_background(start, end)
+            self.canvas.restore_region(self._bg)
+            self.ax.draw_artist(self._line)
+            self.ax.draw_artist(self._legend)
+            self.canvas.blit(self.ax.bbox)
 
         except Exception as e:
             logger.error(f"Graph plotting error: {e}")
-            self.ax.clear()
-            self.ax.text(0.5, 0.5, f"Error: {str(e)}", 
-                        fontsize=12, color='red', 
-                        ha='center', va='center', 
-                        transform=self.ax.transAxes)
-            self.canvas.draw()
+            self._line.set_data([], [])
+            self._err_text.set_text(f"Error: {str(e)}")
+            self._has_plot = True
+            self._refresh_background(start, end)
+            self.canvas.restore_region(self._bg)
+            self.ax.draw_artist(self._err_text)
+            self.canvas.blit(self.ax.bbox)
 
 
 class ScientificCalculatorApp:
     """Main application class for Scientific Calculator and Graph Plotter."""
 
+    # Trig dispatch table and precomputed pi/180 for degree conversion
+    _TRIG = {'sin': math.sin, 'cos': math.cos, 'tan': math.tan}
+    _DEG_TO_RAD = 0.017453292519943295
+
     # Initialize the main application. Args: root (tk.Tk): Root tkinter window 
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -119,7 +336,12 @@ class ScientificCalculatorApp:
         self.root.geometry("600x600")
         
         self.config = ScientificCalculatorConfig()
-        self.calc_operator = ""
+        # Expression is kept as a list of tokens so append/delete are O(1)
+        # instead of rebuilding the whole string on every keypress
+        self._tokens = []
+        # Float shadow of the last computed result, so chained operations
+        # (sin -> cos -> log) skip re-parsing the displayed string
+        self._numeric = None
         self.text_input = tk.StringVar()
         
         self._create_ui()
@@ -185,204 +407,170 @@ class ScientificCalculatorApp:
         self._create_calculator_buttons(button_params, button_params_main)
 
     def _create_calculator_buttons(self, button_params, button_params_main):
-        # Row 1
-        tk.Button(self.frame_calculator, button_params, text='abs', 
-                  command=lambda: self._button_click('abs(')).grid(row=1, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='mod', 
-                  command=lambda: self._button_click('%')).grid(row=1, column=1, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='div', 
-                  command=lambda: self._button_click('//')).grid(row=1, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='x!', 
-                  command=self._fact_func).grid(row=1, column=3, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='e', 
-                  command=lambda: self._button_click(str(math.e))).grid(row=1, column=4, sticky="nsew")
-        # Row 2
-        tk.Button(self.frame_calculator, button_params, text='sin', 
-                  command=self._trig_sin).grid(row=2, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='cos',
-                  command=self._trig_cos).grid(row=2, column=1, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='tan',
-                  command=self._trig_tan).grid(row=2, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='cot',
-                  command=self._trig_cot).grid(row=2, column=3, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='π',
-                  command=lambda:self._button_click(str(math.pi))).grid(row=2, column=4, sticky="nsew")
-        # Row 3
-        tk.Button(self.frame_calculator, button_params, text='x\u00B2',
-                  command=lambda:self._button_click('**2')).grid(row=3, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='x\u00B3',
-                  command=lambda:self._button_click('**3')).grid(row=3, column=1, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='x^n',
-                  command=lambda:self._button_click('**')).grid(row=3, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='x\u207b\xb9',
-                  command=lambda:self._button_click('**(-1)')).grid(row=3, column=3, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='10^x', font=('sans-serif', 15, 'bold'),
-                  command=lambda:self._button_click('10**')).grid(row=3, column=4, sticky="nsew")     
-        # Row 4
-        tk.Button(self.frame_calculator, button_params, text='\u00B2\u221A',
-                  command=self._square_root).grid(row=4, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='\u00B3\u221A',
-                  command=self._third_root).grid(row=4, column=1, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='\u221A',
-                  command=lambda:self._button_click('**(1/')).grid(row=4, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='log\u2081\u2080', font=('sans-serif', 16, 'bold'),
-                  command=self._log_base_10).grid(row=4, column=3, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='ln',
-                  command=self._ln).grid(row=4, column=4, sticky="nsew")
-        # Row 5
-        tk.Button(self.frame_calculator, button_params, text='(',
-                  command=lambda:self._button_click('(')).grid(row=5, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text=')',
-                  command=lambda:self._button_click(')')).grid(row=5, column=1, sticky="nsew")  
-        tk.Button(self.frame_calculator, button_params, text='\u00B1',
-                  command=self._sign_change).grid(row=5, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='%',
-                  command=self._percent).grid(row=5, column=3, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params, text='e^x',
-                  command=self._exp_func).grid(row=5, column=4, sticky="nsew")
-        # Row 6
-        tk.Button(self.frame_calculator, button_params_main, text='7',
-                  command=lambda:self._button_click('7')).grid(row=6, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='8',
-                  command=lambda:self._button_click('8')).grid(row=6, column=1, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='9',
-                  command=lambda:self._button_click('9')).grid(row=6, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, bd=5, fg='#000', font=('sans-serif', 20, 'bold'), text='DEL', 
-                  command=self._button_delete, bg='#db701f').grid(row=6, column=3, sticky="nsew")
-        tk.Button(self.frame_calculator, bd=5, fg='#000', font=('sans-serif', 20, 'bold'), text='AC', 
-                  command=self._button_clear_all, bg='#db701f').grid(row=6, column=4, sticky="nsew")
-        # Row 7
-        tk.Button(self.frame_calculator, button_params_main, text='4',
-                  command=lambda:self._button_click('4')).grid(row=7, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='5',
-                  command=lambda:self._button_click('5')).grid(row=7, column=1, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='6',
-                  command=lambda:self._button_click('6')).grid(row=7, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='*',
-                  command=lambda:self._button_click('*')).grid(row=7, column=3, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='/',
-                  command=lambda:self._button_click('/')).grid(row=7, column=4, sticky="nsew")
-        # Row 8
-        tk.Button(self.frame_calculator, button_params_main, text='1',
-                  command=lambda:self._button_click('1')).grid(row=8, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='2',
-                  command=lambda:self._button_click('2')).grid(row=8, column=1, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='3',
-                  command=lambda:self._button_click('3')).grid(row=8, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='+',
-                  command=lambda:self._button_click('+')).grid(row=8, column=3, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='-',
-                  command=lambda:self._button_click('-')).grid(row=8, column=4, sticky="nsew")
-        # Row 9 - special handling for equal button
-        tk.Button(self.frame_calculator, button_params_main, text='0', 
-                  command=lambda:self._button_click('0')).grid(row=9, column=0, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='.', 
-                  command=lambda:self._button_click('.')).grid(row=9, column=1, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='EXP', font=('sans-serif', 16, 'bold'), 
-                  command=lambda:self._button_click('*10**')).grid(row=9, column=2, sticky="nsew")
-        tk.Button(self.frame_calculator, button_params_main, text='=', 
-                  command=self._button_equal).grid(row=9, columnspan=2, column=3, sticky="nsew")
+        click = self._button_click
+        trig = self._apply_trig
+
+        # Scientific buttons as (text, row, column, command[, font]);
+        # per-character inserts are pre-bound with functools.partial so
+        # no per-button closure is allocated at startup
+        sci_buttons = [
+            # Row 1
+            ('abs', 1, 0, functools.partial(click, 'abs(')),
+            ('mod', 1, 1, functools.partial(click, '%')),
+            ('div', 1, 2, functools.partial(click, '//')),
+            ('x!', 1, 3, self._fact_func),
+            ('e', 1, 4, functools.partial(click, _E_STR)),
+            # Row 2
+            ('sin', 2, 0, functools.partial(trig, 'sin')),
+            ('cos', 2, 1, functools.partial(trig, 'cos')),
+            ('tan', 2, 2, functools.partial(trig, 'tan')),
+            ('cot', 2, 3, functools.partial(trig, 'cot')),
+            ('\u03c0', 2, 4, functools.partial(click, _PI_STR)),
+            # Row 3
+            ('x\u00B2', 3, 0, functools.partial(click, '**2')),
+            ('x\u00B3', 3, 1, functools.partial(click, '**3')),
+            ('x^n', 3, 2, functools.partial(click, '**')),
+            ('x\u207b\xb9', 3, 3, functools.partial(click, '**(-1)')),
+            ('10^x', 3, 4, functools.partial(click, '10**'), ('sans-serif', 15, 'bold')),
+            # Row 4
+            ('\u00B2\u221A', 4, 0, self._square_root),
+            ('\u00B3\u221A', 4, 1, self._third_root),
+            ('\u221A', 4, 2, functools.partial(click, '**(1/')),
+            ('log\u2081\u2080', 4, 3, self._log_base_10, ('sans-serif', 16, 'bold')),
+            ('ln', 4, 4, self._ln),
+            # Row 5
+            ('(', 5, 0, functools.partial(click, '(')),
+            (')', 5, 1, functools.partial(click, ')')),
+            ('\u00B1', 5, 2, self._sign_change),
+            ('%', 5, 3, self._percent),
+            ('e^x', 5, 4, self._exp_func)]
+
+        # Widgets are created in one pass and positioned in a second,
+        # so the geometry-manager calls run as one contiguous batch of
+        # Tcl crossings instead of interleaving create/grid per button
+        placements = []
+        for text, row, col, command, *font in sci_buttons:
+            params = dict(button_params, font=font[0]) if font else button_params
+            btn = tk.Button(self.frame_calculator, params, text=text,
+                            command=command)
+            placements.append((btn, row, col, {}))
 
         # Number and operation buttons
         numbers_operators = [('7', '8', '9', 'DEL', 'AC'),
                              ('4', '5', '6', '*', '/'),
                              ('1', '2', '3', '+', '-'),
                              ('0', '.', 'EXP', '=', None)]
-        
+
         for row_idx, row in enumerate(numbers_operators, start=6):
             for col_idx, btn_text in enumerate(row):
                 if btn_text:
+                    grid_extra = {}
                     if btn_text in ('DEL', 'AC'):
                         btn_cmd = self._button_delete if btn_text == 'DEL' else self._button_clear_all
-                        tk.Button(self.frame_calculator, button_params_main, text=btn_text, command=btn_cmd, 
-                                  bg=self.config.style['highlight']).grid(row=row_idx, column=col_idx, sticky="nsew")
+                        btn = tk.Button(self.frame_calculator, button_params_main, text=btn_text,
+                                        command=btn_cmd, bg=self.config.style['highlight'])
                     elif btn_text == '=':
-                        tk.Button(self.frame_calculator, button_params_main, text='=', 
-                                  command=self._button_equal).grid(row=row_idx, column=col_idx, columnspan=2, sticky="nsew")
+                        btn = tk.Button(self.frame_calculator, button_params_main, text='=',
+                                        command=self._button_equal)
+                        grid_extra = {'columnspan': 2}
                     elif btn_text == 'EXP':
-                        tk.Button(self.frame_calculator, button_params_main, text='EXP', 
-                                  command=lambda: self._button_click('*10**')).grid(row=row_idx, column=col_idx, sticky="nsew")
+                        btn = tk.Button(self.frame_calculator, button_params_main, text='EXP',
+                                        command=functools.partial(self._button_click, '*10**'))
                     else:
-                        tk.Button(self.frame_calculator, button_params_main, text=btn_text, 
-                                  command=lambda x=btn_text: self._button_click(x)).grid(row=row_idx, column=col_idx, sticky="nsew")
+                        btn = tk.Button(self.frame_calculator, button_params_main, text=btn_text,
+                                        command=functools.partial(self._button_click, btn_text))
+                    placements.append((btn, row_idx, col_idx, grid_extra))
+
+        for btn, row, col, extra in placements:
+            btn.grid(row=row, column=col, sticky="nsew", **extra)
+
+    # String view over the token buffer; the setter resets the buffer so
+    # the helper call sites keep assigning plain result strings.
+    @property
+    def calc_operator(self):
+        return ''.join(self._tokens)
+
+    @calc_operator.setter
+    def calc_operator(self, value):
+        self._tokens = [value] if value else []
+        self._numeric = None
+
+    # Current expression as a float, preferring the numeric shadow over
+    # re-parsing the display string.
+    def _current_value(self):
+        return self._numeric if self._numeric is not None else float(self.calc_operator)
 
     '''Defining Buttons in Calculator frame.'''
     def _button_click(self, char):
         # Add a character to the current expression.
-        self.calc_operator += str(char)
-        self.text_input.set(self.calc_operator)
+        self._tokens.append(str(char))
+        self._numeric = None
+        self.text_input.set(''.join(self._tokens))
 
     def _button_clear_all(self):
         # Clear the entire expression.
-        self.calc_operator = ""
+        self._tokens.clear()
+        self._numeric = None
         self.text_input.set("")
 
     def _button_delete(self):
-        # Delete the last character.
-        self.calc_operator = self.calc_operator[:-1]
-        self.text_input.set(self.calc_operator)
+        # Delete the last character (trimming multi-character tokens).
+        if self._tokens:
+            last = self._tokens[-1]
+            if len(last) > 1:
+                self._tokens[-1] = last[:-1]
+            else:
+                self._tokens.pop()
+        self._numeric = None
+        self.text_input.set(''.join(self._tokens))
 
     def _button_equal(self):
         result = MathExpressionEvaluator.safe_evaluate(self.calc_operator, precision=self.config.precision)
         self.text_input.set(result)
         self.calc_operator = result
 
-    def _trig_sin(self):
-        try:
-            angle = float(self.calc_operator)
-            result = str(round(math.sin(math.radians(angle)), 8))
-            self.calc_operator = result
-            self.text_input.set(result)
-        except Exception as e:
-            self.text_input.set("ERROR")
-            logger.error(f"Sine calculation error: {e}")
-
-    def _trig_cos(self):
-        try:
-            angle = float(self.calc_operator)
-            result = str(round(math.cos(math.radians(angle)), 8))
-            self.calc_operator = result
-            self.text_input.set(result)
-        except Exception as e:
-            self.text_input.set("ERROR")
-            logger.error(f"Cosine calculation error: {e}")
-
-    def _trig_tan(self):
-        try:
-            angle = float(self.calc_operator)
-            # Check for special cases that cause tangent to be undefined
-            if abs(angle % 180 - 90) < 1e-10:  # Handling angles close to 90, 270, etc.
-                self.text_input.set("UNDEFINED")
-                self.calc_operator = ""
-                return
-            result = str(round(math.tan(math.radians(angle)), 8))
-            self.calc_operator = result
-            self.text_input.set(result)
-        except Exception as e:
-            self.text_input.set("ERROR")
-            logger.error(f"Tangent calculation error: {e}")
-
-    def _trig_cot(self):
+    # Shared handler for sin/cos/tan/cot buttons; the angle is taken in
+    # degrees and the trig function resolved via the _TRIG dispatch table.
+    def _apply_trig(self, name):
         try:
-            angle = float(self.calc_operator)
-            # Check for special cases that cause cotangent to be undefined
-            if abs(angle % 180) < 1e-10:  # Handling angles close to 0, 180, 360, etc.
+            angle = self._current_value()
+            # math.fmod is a single C call, unlike float %, which goes
+            # through Python-level modulo with an extra PyFloat per test.
+            # m lies in [0, 180), so the cot guard must also test 180 - m
+            # to catch angles just below a multiple of 180; the tan pole
+            # at 90 sits inside the interval and needs no wrap
+            m = math.fmod(abs(angle), 180.0)
+            if name == 'tan' and abs(m - 90.0) < 1e-10:
+                # Handling angles close to 90, 270, etc.
                 self.text_input.set("UNDEFINED")
                 self.calc_operator = ""
                 return
-            result = str(round(1/math.tan(math.radians(angle)), 8))
+            if name == 'cot':
+                if min(m, 180.0 - m) < 1e-10:
+                    # Handling angles close to 0, 180, 360, etc.
+                    self.text_input.set("UNDEFINED")
+                    self.calc_operator = ""
+                    return
+                r = 1.0 / self._TRIG['tan'](angle * self._DEG_TO_RAD)
+            else:
+                r = self._TRIG[name](angle * self._DEG_TO_RAD)
+            result = f"{r:.8f}"
             self.calc_operator = result
+            self._numeric = r
             self.text_input.set(result)
         except Exception as e:
             self.text_input.set("ERROR")
-            logger.error(f"Cotangent calculation error: {e}")
+            logger.error(f"{name} calculation error: {e}")
 
     def _square_root(self):
         try:
+            v = self._current_value()
             # Check if the number is non-negative
-            if float(self.calc_operator) >= 0:
-                result = MathExpressionEvaluator.safe_evaluate(f"sqrt({self.calc_operator})")
+            if v >= 0:
+                r = math.sqrt(v)
+                result = f"{r:.8f}"
                 self.calc_operator = result
+                self._numeric = r
                 self.text_input.set(result)
             else:
                 self.text_input.set("ERROR")
@@ -392,9 +580,11 @@ class ScientificCalculatorApp:
 
     def _log_base_10(self):
         try:
-            value = float(self.calc_operator)
-            result = str(round(math.log10(value), 8))
+            value = self._current_value()
+            r = math.log10(value)
+            result = f"{r:.8f}"
             self.calc_operator = result
+            self._numeric = r
             self.text_input.set(result)
         except Exception as e:
             self.text_input.set("ERROR")
@@ -402,9 +592,11 @@ class ScientificCalculatorApp:
 
     def _ln(self):
         try:
-            value = float(self.calc_operator)
-            result = str(round(math.log(value), 8))
+            value = self._current_value()
+            r = math.log(value)
+            result = f"{r:.8f}"
             self.calc_operator = result
+            self._numeric = r
             self.text_input.set(result)
         except Exception as e:
             self.text_input.set("ERROR")
@@ -412,9 +604,11 @@ class ScientificCalculatorApp:
 
     def _exp_func(self):
         try:
-            value = float(self.calc_operator)
-            result = str(round(math.exp(value), 8))
+            value = self._current_value()
+            r = math.exp(value)
+            result = f"{r:.8f}"
             self.calc_operator = result
+            self._numeric = r
             self.text_input.set(result)
         except Exception as e:
             self.text_input.set("ERROR")
@@ -431,12 +625,14 @@ class ScientificCalculatorApp:
 
     def _sign_change(self):
         try:
-            # If the expression starts with a minus, remove it
-            if self.calc_operator and self.calc_operator[0] == '-':
-                result = self.calc_operator[1:]
+            expr = self.calc_operator
+            # If the expression starts with a minus, remove it;
+            # startswith handles the empty string without a bounds check
+            if expr.startswith('-'):
+                result = expr[1:]
             else:
                 # Otherwise, add a minus sign
-                result = '-' + self.calc_operator
+                result = '-' + expr
             self.calc_operator = result
             self.text_input.set(result)
         except Exception as e:
@@ -445,7 +641,18 @@ class ScientificCalculatorApp:
 
     def _percent(self):
         try:
-            result = MathExpressionEvaluator.safe_evaluate(f"{self.calc_operator}/100")
+            # Plain numbers divide directly; expressions fall back to the
+            # full evaluator
+            try:
+                r = self._current_value() / 100.0
+            except ValueError:
+                result = MathExpressionEvaluator.safe_evaluate(f"{self.calc_operator}/100")
+            else:
+                result = f"{r:.8f}"
+                self.calc_operator = result
+                self._numeric = r
+                self.text_input.set(result)
+                return
             self.calc_operator = result
             self.text_input.set(result)
         except Exception as e:
@@ -454,7 +661,17 @@ class ScientificCalculatorApp:
     
     def _fact_func(self):
         try:
-            result = MathExpressionEvaluator.safe_evaluate(f"factorial({self.calc_operator})")
+            # Non-negative integers go straight to the C-level
+            # math.factorial; anything else falls back to the evaluator
+            try:
+                v = self._current_value()
+                n = int(v)
+            except (ValueError, OverflowError):
+                n = None
+            if n is not None and n >= 0 and abs(v - n) < 1e-12:
+                result = str(math.factorial(n))
+            else:
+                result = MathExpressionEvaluator.safe_evaluate(f"factorial({self.calc_operator})")
             self.calc_operator = result
             self.text_input.set(result)
         except Exception as e: